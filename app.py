@@ -1,7 +1,23 @@
 import re
-from typing import List, Dict, Any
+from typing import List, Dict, Any, NamedTuple, Tuple
 import streamlit as st
-import pandas as pd
+
+# ======================================================
+# Compiled Patterns
+# ======================================================
+
+_HMM_RE = re.compile(r"^(\d{1,3}):([0-5]\d)$")
+_TIME_TOKEN_RE = re.compile(r"\b(\d{1,3}):([0-5]\d)\b")
+_REG_ROW_DETECT_RE = re.compile(r"\b\d{2}[A-Z]{3}\s+REG\b")
+_CARD_ROW_DETECT_RE = re.compile(r"\b\d{2}[A-Z]{3}\s+(RES|REG)\b")
+_EQ_TIME_RE = re.compile(r"=\s*([0-9]{1,3}:[0-5]\d)")
+_TRNG_PAY_RE = re.compile(
+    r"DISTRIBUTED\s+TRNG\s+PAY:\s+([0-9]{1,3}:[0-5][0-9])",
+    re.I,
+)
+
+# label -> (with-colon pattern, without-colon pattern)
+_BUCKET_RE_CACHE: Dict[str, Tuple[re.Pattern, re.Pattern]] = {}
 
 # ======================================================
 # Helpers
@@ -10,19 +26,38 @@ import pandas as pd
 def to_minutes(s: str) -> int:
     if not isinstance(s, str):
         return 0
-    m = re.match(r"^(\d{1,3}):([0-5]\d)$", s.strip())
+    m = _HMM_RE.match(s.strip())
     if not m:
         return 0
     return int(m.group(1)) * 60 + int(m.group(2))
 
+def _to_minutes_fast(s: str) -> int:
+    """
+    to_minutes for tokens already matched by an H:MM regex -- no checks.
+    """
+    h, _, m = s.partition(":")
+    return int(h) * 60 + int(m)
+
+# "00".."59", so from_minutes skips the :02d format spec
+_MM = tuple(f"{m:02d}" for m in range(60))
+
 def from_minutes(mins: int) -> str:
-    mins = max(0, int(mins))
-    h, m = divmod(mins, 60)
-    return f"{h}:{m:02d}"
+    if mins <= 0:
+        return "0:00"
+    h = mins // 60
+    return f"{h}:{_MM[mins - h * 60]}"
 
 def clean(t: str) -> str:
     return (t or "").replace("\u00A0", " ")
 
+def _fold(t: str) -> str:
+    """
+    Case-fold for literal substring pre-checks of re.I patterns. re.I
+    also lets dotted/dotless i match "i", so fold those in too; this can
+    only widen a match, never hide one.
+    """
+    return t.casefold().replace("\u0131", "i").replace("\u0307", "")
+
 # ======================================================
 # Detect Card Type
 # ======================================================
@@ -33,73 +68,115 @@ def detect_card_type(raw: str) -> str:
     RES rows present (or mixed) -> RESERVE
     default -> RESERVE
     """
-    t = clean(raw).upper()
-    saw_res_row = re.search(r"\b\d{2}[A-Z]{3}\s+RES\b", t) is not None
-    saw_reg_row = re.search(r"\b\d{2}[A-Z]{3}\s+REG\b", t) is not None
-
-    if saw_res_row and not saw_reg_row:
-        return "RESERVE"
-    if saw_reg_row and not saw_res_row:
-        return "LINEHOLDER"
-    if saw_res_row and saw_reg_row:
+    return _detect_card_type(clean(raw))
+
+def _detect_card_type(t: str) -> str:
+    """detect_card_type for text that has already been through clean()."""
+    t = t.upper()
+    # the row patterns need a literal RES/REG; plain substring checks
+    # settle most cards before the regex engine is involved
+    if "REG" not in t:
         return "RESERVE"
-    return "RESERVE"
+    if "RES" not in t:
+        return "LINEHOLDER" if _REG_ROW_DETECT_RE.search(t) else "RESERVE"
+
+    # one scan for both row kinds; the first RES row settles it
+    saw_reg_row = False
+    for m in _CARD_ROW_DETECT_RE.finditer(t):
+        if m.group(1) == "RES":
+            return "RESERVE"
+        saw_reg_row = True
+    return "LINEHOLDER" if saw_reg_row else "RESERVE"
 
 # ======================================================
 # Row Parsers
 # ======================================================
 
-def _row_regex(prefix: str) -> re.Pattern:
+class Row(NamedTuple):
     """
-    Build a parser for either RES or REG rows. We stop before:
+    One parsed RES/REG duty row. Times are kept both as the raw digit
+    pairs and as minutes so the calculators never re-parse them.
+    """
+    date: str
+    nbr: str
+    times_hm: List[Tuple[str, str]]  # ("10", "30") for 10:30
+    times_min: List[int]
+
+def _row_patterns(prefix: str) -> Tuple[re.Pattern, re.Pattern]:
+    """
+    Build the (row start, row stop) patterns for either RES or REG rows.
+    A row runs from its header up to (not including) the first of:
     - next row of same type
     - summary blocks
     - END OF DISPLAY
     """
-    return re.compile(
-        rf"(?P<date>\d{{2}}[A-Z]{{3}})\s+{prefix}\s+(?P<nbr>[A-Z0-9/-]+)"
-        rf"(?P<tail>.*?)(?="
+    head = re.compile(
+        rf"(?P<date>\d{{2}}[A-Z]{{3}})\s+{prefix}\s+(?P<nbr>[A-Z0-9/-]+)",
+        re.I,
+    )
+    stop = re.compile(
         rf"\d{{2}}[A-Z]{{3}}\s+{prefix}\b|"
         r"RES\s+OTHER\s+SUB\s+TTL|"
         r"CREDIT\s+APPLICABLE|"
-        r"END OF DISPLAY|$)",
-        re.I | re.S,
+        r"END OF DISPLAY",
+        re.I,
     )
+    return head, stop
 
-def parse_lineholder_rows(raw: str) -> List[Dict[str, Any]]:
-    t = clean(raw)
-    seg_re = _row_regex("REG")
-    rows = []
-    for m in seg_re.finditer(t):
-        seg_full = m.group(0)
-        times = re.findall(r"\b\d{1,3}:[0-5]\d\b", seg_full)
-        rows.append({
-            "date": (m.group("date") or "").upper(),
-            "nbr": (m.group("nbr") or "").upper(),
-            "times": times,
-            "raw": seg_full.strip(),
-        })
-    return rows
+_REG_ROW_PATS = _row_patterns("REG")
+_RES_ROW_PATS = _row_patterns("RES")
 
-def parse_reserve_rows(raw: str) -> List[Dict[str, Any]]:
-    t = clean(raw)
-    seg_re = _row_regex("RES")
+def _parse_rows(t: str, pats: Tuple[re.Pattern, re.Pattern]) -> List[Row]:
+    """
+    Single left-to-right pass: find a row header, find where that row
+    stops, and pull its times from that span. No lazy-tail backtracking.
+    Times are converted to minutes here, once, for all the calculators.
+    `t` must already have been through clean().
+    """
+    head_re, stop_re = pats
+    # a row with no stop marker runs to the end (before a final newline)
+    text_end = len(t) - 1 if t.endswith("\n") else len(t)
     rows = []
-    for m in seg_re.finditer(t):
-        seg_full = m.group(0)
-        times = re.findall(r"\b\d{1,3}:[0-5]\d\b", seg_full)
-        rows.append({
-            "date": (m.group("date") or "").upper(),
-            "nbr": (m.group("nbr") or "").upper(),
-            "times": times,
-            "raw": seg_full.strip(),
-        })
+    pos = 0
+    while True:
+        m = head_re.search(t, pos)
+        if not m:
+            break
+        stop = stop_re.search(t, m.end())
+        pos = stop.start() if stop else text_end
+        times_hm = _TIME_TOKEN_RE.findall(t, m.start(), pos)
+        date, nbr = m.group(1, 2)
+        rows.append(Row(
+            date.upper(),
+            nbr.upper(),
+            times_hm,
+            [int(h) * 60 + int(mm) for h, mm in times_hm],
+        ))
     return rows
 
+def parse_lineholder_rows(raw: str) -> List[Row]:
+    return _parse_rows(clean(raw), _REG_ROW_PATS)
+
+def parse_reserve_rows(raw: str) -> List[Row]:
+    return _parse_rows(clean(raw), _RES_ROW_PATS)
+
 # ======================================================
 # Extractors
 # ======================================================
 
+def _bucket_patterns(lbl: str) -> Tuple[re.Pattern, re.Pattern]:
+    """
+    Compile (and cache) the colon / no-colon value patterns for a label.
+    """
+    pats = _BUCKET_RE_CACHE.get(lbl)
+    if pats is None:
+        pats = (
+            re.compile(re.escape(lbl) + r"\s*:\s*([0-9]{1,3}:[0-5][0-9])", re.I),
+            re.compile(re.escape(lbl) + r"\s+([0-9]{1,3}:[0-5][0-9])", re.I),
+        )
+        _BUCKET_RE_CACHE[lbl] = pats
+    return pats
+
 def extract_named_bucket(text: str, labels: List[str]) -> int:
     """
     Looks for values after named buckets like:
@@ -110,24 +187,28 @@ def extract_named_bucket(text: str, labels: List[str]) -> int:
       TTL BANK OPTS AWARD 0:00
     """
     t = clean(text)
+    return _extract_named_bucket(t, labels, _fold(t))
+
+def _extract_named_bucket(t: str, labels: List[str], folded: str) -> int:
+    """
+    extract_named_bucket for text that has already been through clean().
+    `folded` is _fold(t), shared across lookups on the same text.
+    """
     for lbl in labels:
+        # cheap literal pre-check: most cards carry only a few of the labels
+        if lbl.casefold() not in folded:
+            continue
+        pat_colon, pat_nocolon = _bucket_patterns(lbl)
+
         # with colon
-        pat_colon = re.compile(
-            re.escape(lbl) + r"\s*:\s*([0-9]{1,3}:[0-5][0-9])",
-            flags=re.I,
-        )
         m = pat_colon.search(t)
         if m:
-            return to_minutes(m.group(1))
+            return _to_minutes_fast(m.group(1))
 
         # without colon
-        pat_nocolon = re.compile(
-            re.escape(lbl) + r"\s+([0-9]{1,3}:[0-5][0-9])",
-            flags=re.I,
-        )
         m2 = pat_nocolon.search(t)
         if m2:
-            return to_minutes(m2.group(1))
+            return _to_minutes_fast(m2.group(1))
 
     return 0
 
@@ -138,10 +219,17 @@ def grab_sub_ttl_credit_minutes(raw: str) -> int:
       39:37 + 35:08 + 0:00 = 74:45 - 0:00 + 0:00 = 74:45 -> 74:45
       68:34 + 0:00 + 0:00 = 68:34 - 0:00 + 3:26 = 72:00 -> 72:00
     """
-    t = clean(raw)
-    eq_times = re.findall(r"=\s*([0-9]{1,3}:[0-5]\d)", t)
-    if eq_times:
-        return to_minutes(eq_times[-1])
+    return _grab_sub_ttl_credit_minutes(clean(raw))
+
+def _grab_sub_ttl_credit_minutes(t: str) -> int:
+    """grab_sub_ttl_credit_minutes for text that has already been through clean()."""
+    # walk '=' signs from the end; the first one followed by a time wins
+    i = t.rfind("=")
+    while i >= 0:
+        m = _EQ_TIME_RE.match(t, i)
+        if m:
+            return _to_minutes_fast(m.group(1))
+        i = t.rfind("=", 0, i)
     return 0
 
 def extract_training_pay_minutes(raw: str) -> int:
@@ -150,33 +238,32 @@ def extract_training_pay_minutes(raw: str) -> int:
     Example:
       DISTRIBUTED TRNG PAY:   1:52
     """
-    t = clean(raw)
+    return _extract_training_pay_minutes(clean(raw))
+
+def _extract_training_pay_minutes(t: str) -> int:
+    """extract_training_pay_minutes for text that has already been through clean()."""
     total = 0
-    for m in re.finditer(
-        r"DISTRIBUTED\s+TRNG\s+PAY:\s+([0-9]{1,3}:[0-5][0-9])",
-        t,
-        flags=re.I,
-    ):
-        total += to_minutes(m.group(1))
+    for m in _TRNG_PAY_RE.finditer(t):
+        total += _to_minutes_fast(m.group(1))
     return total
 
 # ======================================================
 # Lineholder Logic
 # ======================================================
 
-def calc_pay_time_only_lineholder(rows: List[Dict[str, Any]]) -> int:
+def calc_pay_time_only_lineholder(rows: List[Row]) -> int:
     """
     PAY TIME ONLY for lineholder:
     Sum rows that have exactly ONE time (e.g. REG RRPY 3:09).
     """
     total = 0
     for r in rows:
-        times = r["times"]
-        if len(times) == 1:
-            total += to_minutes(times[0])
+        times_min = r.times_min
+        if len(times_min) == 1:
+            total += times_min[0]
     return total
 
-def calc_addtl_pay_only_lineholder(rows: List[Dict[str, Any]]) -> int:
+def calc_addtl_pay_only_lineholder(rows: List[Row]) -> int:
     """
     ADDTL PAY ONLY COLUMN for lineholder:
     If last time < previous time, add the last time.
@@ -184,10 +271,10 @@ def calc_addtl_pay_only_lineholder(rows: List[Dict[str, Any]]) -> int:
     """
     total = 0
     for r in rows:
-        times = r["times"]
-        if len(times) >= 2:
-            prev_last = to_minutes(times[-2])
-            last = to_minutes(times[-1])
+        times_min = r.times_min
+        if len(times_min) >= 2:
+            prev_last = times_min[-2]
+            last = times_min[-1]
             if last < prev_last:
                 total += last
     return total
@@ -196,7 +283,7 @@ def calc_addtl_pay_only_lineholder(rows: List[Dict[str, Any]]) -> int:
 # Reserve Logic
 # ======================================================
 
-def calc_pay_time_only_reserve_structural(rows: List[Dict[str, Any]]) -> int:
+def calc_pay_time_only_reserve_structural(rows: List[Row]) -> int:
     """
     Reserve PAY TIME ONLY lines under final structural rule:
 
@@ -219,11 +306,11 @@ def calc_pay_time_only_reserve_structural(rows: List[Dict[str, Any]]) -> int:
     total = 0
 
     for r in rows:
-        times = r["times"]
+        times = r.times_hm
         if not times:
             continue
 
-        mins_list = [to_minutes(t) for t in times]
+        mins_list = r.times_min
 
         # detect block hrs style (first < second)
         has_block_hrs = False
@@ -246,7 +333,7 @@ def calc_pay_time_only_reserve_structural(rows: List[Dict[str, Any]]) -> int:
 
     return total
 
-def calc_addtl_pay_only_reserve(rows: List[Dict[str, Any]]) -> int:
+def calc_addtl_pay_only_reserve(rows: List[Row]) -> int:
     """
     ADDTL PAY ONLY COLUMN for Reserve:
     Tail bumps where final time is less than the time right before it
@@ -254,10 +341,10 @@ def calc_addtl_pay_only_reserve(rows: List[Dict[str, Any]]) -> int:
     """
     total = 0
     for r in rows:
-        times = r["times"]
-        if len(times) >= 2:
-            prev_last = to_minutes(times[-2])
-            last = to_minutes(times[-1])
+        times_min = r.times_min
+        if len(times_min) >= 2:
+            prev_last = times_min[-2]
+            last = times_min[-1]
             if last < prev_last:
                 total += last
     return total
@@ -266,18 +353,64 @@ def calc_addtl_pay_only_reserve(rows: List[Dict[str, Any]]) -> int:
 # Compute Totals
 # ======================================================
 
+# breakdown keys per card type, in the order compute_totals returns them
+_LINEHOLDER_COMPONENTS = (
+    "TTL CREDIT",
+    "PAY TIME ONLY (single-time rows only)",
+    "ADDTL PAY ONLY COLUMN",
+    "G/SLIP PAY x2",
+    "ASSIGN PAY x2",
+    "TOTAL",
+)
+_RESERVE_COMPONENTS = (
+    "TTL CREDIT",
+    "PAY TIME ONLY (structural)",
+    "ADDTL PAY ONLY COLUMN",
+    "RES ASSIGN-G/SLIP PAY",
+    "ASSIGN PAY",
+    "REROUTE PAY",
+    "DISTRIBUTED TRNG PAY",
+    "TTL BANK OPTS AWARD",
+    "TOTAL",
+)
+
+def _format_totals(card_type: str, keys: Tuple[str, ...], mins: Tuple[int, ...]) -> Dict[str, Any]:
+    """
+    Pair each breakdown key with its formatted minutes, in order.
+    """
+    return {"card_type": card_type, **dict(zip(keys, map(from_minutes, mins)))}
+
+def _zero_totals(card_type: str) -> Dict[str, Any]:
+    """
+    Result for text with no H:MM values at all: every component is 0:00.
+    """
+    keys = _LINEHOLDER_COMPONENTS if card_type == "LINEHOLDER" else _RESERVE_COMPONENTS
+    return {"card_type": card_type, **dict.fromkeys(keys, "0:00")}
+
+@st.cache_data(max_entries=8, show_spinner=False)
 def compute_totals(raw: str) -> Dict[str, Any]:
-    card_type = detect_card_type(raw)
+    """
+    Pure function of the pasted text, so Streamlit reruns with the same
+    text (button clicks, sidebar toggles) reuse the previous result.
+    """
+    # normalize once; every helper below works on the cleaned text
+    t = clean(raw)
+    card_type = _detect_card_type(t)
+    # every component is an H:MM value, so with no ':' anywhere there is
+    # nothing to scan for (card type above still applies)
+    if ":" not in t:
+        return _zero_totals(card_type)
+    folded = _fold(t)
 
     if card_type == "LINEHOLDER":
-        rows = parse_lineholder_rows(raw)
+        rows = _parse_rows(t, _REG_ROW_PATS)
 
-        ttl_credit_mins = grab_sub_ttl_credit_minutes(raw)
+        ttl_credit_mins = _grab_sub_ttl_credit_minutes(t)
         pay_only_mins = calc_pay_time_only_lineholder(rows)
         addtl_only_mins = calc_addtl_pay_only_lineholder(rows)
 
-        gslip_mins = extract_named_bucket(raw, ["G/SLIP PAY"])
-        assign_mins = extract_named_bucket(raw, ["ASSIGN PAY"])
+        gslip_mins = _extract_named_bucket(t, ["G/SLIP PAY"], folded)
+        assign_mins = _extract_named_bucket(t, ["ASSIGN PAY"], folded)
 
         gslip_twice_mins = 2 * gslip_mins
         assign_twice_mins = 2 * assign_mins
@@ -290,29 +423,28 @@ def compute_totals(raw: str) -> Dict[str, Any]:
             + assign_twice_mins
         )
 
-        return {
-            "card_type": "LINEHOLDER",
-            "TTL CREDIT": from_minutes(ttl_credit_mins),
-            "PAY TIME ONLY (single-time rows only)": from_minutes(pay_only_mins),
-            "ADDTL PAY ONLY COLUMN": from_minutes(addtl_only_mins),
-            "G/SLIP PAY x2": from_minutes(gslip_twice_mins),
-            "ASSIGN PAY x2": from_minutes(assign_twice_mins),
-            "TOTAL": from_minutes(total_mins),
-        }
+        return _format_totals("LINEHOLDER", _LINEHOLDER_COMPONENTS, (
+            ttl_credit_mins,
+            pay_only_mins,
+            addtl_only_mins,
+            gslip_twice_mins,
+            assign_twice_mins,
+            total_mins,
+        ))
 
     else:
         # RESERVE
-        rows = parse_reserve_rows(raw)
+        rows = _parse_rows(t, _RES_ROW_PATS)
 
-        ttl_credit_mins = grab_sub_ttl_credit_minutes(raw)
+        ttl_credit_mins = _grab_sub_ttl_credit_minutes(t)
         pay_time_only_mins = calc_pay_time_only_reserve_structural(rows)
         addtl_only_mins = calc_addtl_pay_only_reserve(rows)
 
-        res_assign_gslip_mins = extract_named_bucket(raw, ["RES ASSIGN-G/SLIP PAY"])
-        assign_mins = extract_named_bucket(raw, ["ASSIGN PAY"])
-        reroute_mins = extract_named_bucket(raw, ["REROUTE PAY"])
-        ttl_bank_opts_award_mins = extract_named_bucket(raw, ["TTL BANK OPTS AWARD"])
-        training_mins = extract_training_pay_minutes(raw)
+        res_assign_gslip_mins = _extract_named_bucket(t, ["RES ASSIGN-G/SLIP PAY"], folded)
+        assign_mins = _extract_named_bucket(t, ["ASSIGN PAY"], folded)
+        reroute_mins = _extract_named_bucket(t, ["REROUTE PAY"], folded)
+        ttl_bank_opts_award_mins = _extract_named_bucket(t, ["TTL BANK OPTS AWARD"], folded)
+        training_mins = _extract_training_pay_minutes(t)
 
         total_mins = (
             ttl_credit_mins
@@ -325,18 +457,54 @@ def compute_totals(raw: str) -> Dict[str, Any]:
             + ttl_bank_opts_award_mins
         )
 
-        return {
-            "card_type": "RESERVE",
-            "TTL CREDIT": from_minutes(ttl_credit_mins),
-            "PAY TIME ONLY (structural)": from_minutes(pay_time_only_mins),
-            "ADDTL PAY ONLY COLUMN": from_minutes(addtl_only_mins),
-            "RES ASSIGN-G/SLIP PAY": from_minutes(res_assign_gslip_mins),
-            "ASSIGN PAY": from_minutes(assign_mins),
-            "REROUTE PAY": from_minutes(reroute_mins),
-            "DISTRIBUTED TRNG PAY": from_minutes(training_mins),
-            "TTL BANK OPTS AWARD": from_minutes(ttl_bank_opts_award_mins),
-            "TOTAL": from_minutes(total_mins),
-        }
+        return _format_totals("RESERVE", _RESERVE_COMPONENTS, (
+            ttl_credit_mins,
+            pay_time_only_mins,
+            addtl_only_mins,
+            res_assign_gslip_mins,
+            assign_mins,
+            reroute_mins,
+            training_mins,
+            ttl_bank_opts_award_mins,
+            total_mins,
+        ))
+
+# ======================================================
+# Examples
+# ======================================================
+
+_EXAMPLE_LINEHOLDER = (
+    "MONTHLY TIME DATA "
+    "01JUN REG 3554 6:30 TRANS TRANS 10:49 0:13 "
+    "05JUN REG 3210 7:24 10:30 10:30 10:30 "
+    "09JUN REG 3191 6:52 10:30 10:30 10:30 "
+    "17JUN REG 0889 2:20 10:30 10:30 10:30 "
+    "18JUN REG RRPY 3:09 "
+    "23JUN REG C428 15:01 15:45 15:45 15:45 0:38 "
+    "26JUN REG 0608 5:16 10:30 10:30 10:30 3:38 "
+    "27JUN REG RRPY 5:26 "
+    "28JUN REG 0451 1:35 10:30 10:30 3:23 "
+    "68:34 + 0:00 + 0:00 = 68:34 - 0:00 + 3:26 = 72:00 "
+    "G/SLIP PAY : 10:30 ASSIGN PAY: 0:00 "
+    "END OF DISPLAY"
+)
+
+_EXAMPLE_RESERVE = (
+    "01AUG RES SICK 8:48 8:48 8:48 "
+    "04AUG RES 0142 5:09 5:23 5:23 "
+    "06AUG RES SCC 1:00 1:00 "
+    "07AUG RES 0054 1:51 10:30 10:30 10:30 "
+    "13AUG RES SCC 1:00 1:00 "
+    "14AUG RES SCC 1:00 1:00 "
+    "16AUG RES TOFF 4:24 4:24 4:24 "
+    "20AUG RES 0733 2:30 5:25 5:25 5:25 "
+    "27AUG RES 0537 8:28 10:30 10:30 10:30 "
+    "39:37 + 35:08 + 0:00 = 74:45 - 0:00 + 0:00 = 74:45 "
+    "RES ASSIGN-G/SLIP PAY: 5:23 "
+    "ASSIGN PAY: 0:00 "
+    "REROUTE PAY: 0:00 "
+    "END OF DISPLAY"
+)
 
 # ======================================================
 # Streamlit UI
@@ -354,39 +522,10 @@ with st.sidebar:
     st.header("Examples")
 
     if st.button("Load Lineholder Example"):
-        st.session_state["timecard_text"] = (
-            "MONTHLY TIME DATA "
-            "01JUN REG 3554 6:30 TRANS TRANS 10:49 0:13 "
-            "05JUN REG 3210 7:24 10:30 10:30 10:30 "
-            "09JUN REG 3191 6:52 10:30 10:30 10:30 "
-            "17JUN REG 0889 2:20 10:30 10:30 10:30 "
-            "18JUN REG RRPY 3:09 "
-            "23JUN REG C428 15:01 15:45 15:45 15:45 0:38 "
-            "26JUN REG 0608 5:16 10:30 10:30 10:30 3:38 "
-            "27JUN REG RRPY 5:26 "
-            "28JUN REG 0451 1:35 10:30 10:30 3:23 "
-            "68:34 + 0:00 + 0:00 = 68:34 - 0:00 + 3:26 = 72:00 "
-            "G/SLIP PAY : 10:30 ASSIGN PAY: 0:00 "
-            "END OF DISPLAY"
-        )
+        st.session_state["timecard_text"] = _EXAMPLE_LINEHOLDER
 
     if st.button("Load Reserve Example"):
-        st.session_state["timecard_text"] = (
-            "01AUG RES SICK 8:48 8:48 8:48 "
-            "04AUG RES 0142 5:09 5:23 5:23 "
-            "06AUG RES SCC 1:00 1:00 "
-            "07AUG RES 0054 1:51 10:30 10:30 10:30 "
-            "13AUG RES SCC 1:00 1:00 "
-            "14AUG RES SCC 1:00 1:00 "
-            "16AUG RES TOFF 4:24 4:24 4:24 "
-            "20AUG RES 0733 2:30 5:25 5:25 5:25 "
-            "27AUG RES 0537 8:28 10:30 10:30 10:30 "
-            "39:37 + 35:08 + 0:00 = 74:45 - 0:00 + 0:00 = 74:45 "
-            "RES ASSIGN-G/SLIP PAY: 5:23 "
-            "ASSIGN PAY: 0:00 "
-            "REROUTE PAY: 0:00 "
-            "END OF DISPLAY"
-        )
+        st.session_state["timecard_text"] = _EXAMPLE_RESERVE
 
 # init session state
 if "timecard_text" not in st.session_state:
@@ -399,8 +538,7 @@ st.text_area("Paste your timecard text here:", key="timecard_text", height=260)
 colA, colB = st.columns([1, 1])
 if colA.button("Calculate", type="primary"):
     st.session_state["calc"] = True
-if colB.button("Clear", on_click=handle_clear):
-    pass
+colB.button("Clear", on_click=handle_clear)
 
 if st.session_state["calc"]:
     comps = compute_totals(st.session_state["timecard_text"])
@@ -410,10 +548,7 @@ if st.session_state["calc"]:
     c1.metric("Card Type", comps["card_type"])
     c2.metric("TOTAL PAY", comps["TOTAL"])
 
-    df = pd.DataFrame(
-        [(k, v) for k, v in comps.items() if k not in ("card_type",)],
-        columns=["Component", "Time"]
-    )
-    st.table(df)
+    parts = [(k, v) for k, v in comps.items() if k not in ("card_type",)]
+    st.table({"Component": [k for k, _ in parts], "Time": [v for _, v in parts]})
 
 st.caption("All calculations run locally. No data stored.")